@@ -14,28 +14,39 @@ class LinesToPolygon:
     def __init__(self, iface):
         self.iface = iface
         self.action = None
+        self.tiledAction = None
         self.toolbar = None
 
     def initGui(self):
         icon_path = os.path.join(os.path.dirname(__file__), 'icon.png')
         self.action = QAction(QIcon(icon_path), "Lines to polygon", self.iface.mainWindow())
         self.action.triggered.connect(self.run)
+        self.tiledAction = QAction(QIcon(icon_path), "Lines to polygon (tiled, large layers)", self.iface.mainWindow())
+        self.tiledAction.triggered.connect(self.runTiled)
 
         self.iface.addPluginToMenu("&Lines to polygon", self.action)
+        self.iface.addPluginToMenu("&Lines to polygon", self.tiledAction)
         self.iface.addToolBarIcon(self.action)
 
     def unload(self):
         self.iface.removePluginMenu("&Lines to polygon", self.action)
+        self.iface.removePluginMenu("&Lines to polygon", self.tiledAction)
         self.iface.removeToolBarIcon(self.action)
 
     def run(self):
+        self.runPolygonise(tiled=False)
+
+    def runTiled(self):
+        self.runPolygonise(tiled=True)
+
+    def runPolygonise(self, tiled):
         layer = self.iface.activeLayer()
         if not layer:
             QMessageBox.critical(None, "Error", "No active layer selected")
             return
 
         try:
-            polygonise()
+            polygonise(tiled)
             iface.messageBar().pushMessage("Success", "Lines to Polygon complete. Check for layers", level=Qgis.Success, duration=3)
         except Exception as e:
             message = f'Error: {str(e)}'
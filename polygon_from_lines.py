@@ -1,6 +1,7 @@
 from qgis.core import (
     Qgis,
     QgsFeature,
+    QgsFeatureRequest,
     QgsField,
     QgsGeometry,
     QgsGeometryValidator,
@@ -9,10 +10,14 @@ from qgis.core import (
     QgsMarkerSymbol,
     QgsPalLayerSettings,
     QgsPoint,
+    QgsPointXY,
     QgsProject,
+    QgsRectangle,
+    QgsSpatialIndex,
     QgsTextBufferSettings,
     QgsTextFormat,
     QgsVectorLayer,
+    QgsVectorLayerFeatureSource,
     QgsVectorLayerSimpleLabeling,
     QgsWkbTypes
 )
@@ -26,9 +31,24 @@ from qgis.PyQt.QtGui import (
 )
 from qgis.utils import iface
 from PyQt5.QtCore import QDate
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import date
+import math
+import os
 import uuid
 
+try:
+    from .tiling import endpointLinks, gridBounds, groupsFrom, mergeTile, ownsPoint, shouldSplit, splitBounds
+except ImportError: # Run as a script from the QGIS Python console
+    from tiling import endpointLinks, gridBounds, groupsFrom, mergeTile, ownsPoint, shouldSplit, splitBounds
+
+# Most line features read by one tile in tiled mode before the tile is split
+TILE_FEATURE_CAP = 1000
+# How many times a tile may be split. Only more than TILE_FEATURE_CAP lines meeting within a tile this small can go over the cap
+MAX_TILE_DEPTH = 8
+# Most lines in one group that tiled mode will load to make a polygon, larger groups are reported instead
+GROUP_FEATURE_CAP = 10000
+
 # Functions
 #
 def messageOut(messageText, title = 'Info', level=Qgis.Info, duration=10):
@@ -316,6 +336,139 @@ def vertexCheck(layer):
 
     return errorCount, objectCount, pointList
 #
+def checkTile(source, bounds, extent, selectedIds = None, featureCap = None, parentCount = None):
+    """
+    The checks of vertexCheck() for the lines of one tile. Only the features touching the tile are read and, if there are too many of them (see tiling.shouldSplit()), the tile is split instead of checked so memory use stays bounded.
+    A feature is owned by the tile holding its first vertex, an endpoint match by the tile holding the endpoint and a crossing by the tile holding the crossing point (see tiling.ownsPoint()). Lines reaching over the tile border are read by every tile they touch but reported only once.
+    Runs in a worker thread so nothing is added to layers here, errors are returned to the caller instead.
+    Args:
+        source: QgsVectorLayerFeatureSource for the line layer, used by this tile only
+        bounds: bounds tuple (xMin, yMin, xMax, yMax) of the tile
+        extent: bounds tuple the tiles were made from
+        selectedIds: set of feature ids to restrict the check to. Defaults to None for all features
+        featureCap: most features a tile may read before it is split. Defaults to None for no limit
+        parentCount: number of features the tile this one was split from read. Defaults to None for a starting tile
+    Returns:
+        children: list of bounds tuples to check instead if the tile was split, otherwise empty
+        featureCount: number of features the tile read, to pass on to its children
+        owned: list of ids for features owned by this tile
+        links: list of (fid, gid) pairs of lines sharing an endpoint in this tile
+        errors: list of (QgsGeometry, text) pairs for the error point layer
+    """
+    tileRect = QgsRectangle(*bounds)
+    # Grow the request slightly so rounding at the border cannot lose a feature, ownsPoint() decides what belongs here
+    tileRect.grow(max(extent[2] - extent[0], extent[3] - extent[1], 1.0) * 1e-6)
+    featureCount = None
+    if featureCap is not None:
+        countRequest = QgsFeatureRequest().setFilterRect(tileRect).setFlags(QgsFeatureRequest.NoGeometry).setSubsetOfAttributes([])
+        featureCount = 0
+        for feature in source.getFeatures(countRequest):
+            if selectedIds is None or feature.id() in selectedIds:
+                featureCount = featureCount + 1
+        # Lines only passing through are counted too, so a split that does not lower the count is not repeated
+        if shouldSplit(featureCount, featureCap, parentCount):
+            children = splitBounds(bounds)
+            if len(children) > 0:
+                return children, featureCount, [], [], []
+    request = QgsFeatureRequest().setFilterRect(tileRect)
+    tileDict = {}
+    spatialIndex = QgsSpatialIndex()
+    for feature in source.getFeatures(request):
+        if selectedIds is not None and feature.id() not in selectedIds:
+            continue
+        geom = feature.geometry()
+        verts = getVertices(geom)
+        if len(verts) == 0:
+            continue
+        ends = ((verts[0].x(), verts[0].y()), (verts[-1].x(), verts[-1].y()))
+        tileDict[feature.id()] = {'feature':feature, 'geom':geom, 'ends':ends} # Only the endpoints are kept, not the full vertex list
+        spatialIndex.addFeature(feature)
+    owned = []
+    errors = []
+    for fid, item in tileDict.items():
+        if ownsPoint(bounds, extent, item['ends'][0]):
+            owned.append(fid)
+            # Built in geometry error checker - does not consider hanging lines or crossing features as errors
+            for err in checkSingleFeatureValidity(item['feature']):
+                errors.append((QgsGeometry.fromPointXY(err.where()), f'{err.what()}'))
+        # Crossing lines, each pair checked once and reported by the tile holding the crossing point
+        for gid in spatialIndex.intersects(item['geom'].boundingBox()):
+            if gid <= fid or gid not in tileDict:
+                continue
+            if tileDict[gid]['geom'].crosses(item['geom']):
+                intersect = tileDict[gid]['geom'].intersection(item['geom'])
+                crossPoint = intersect.vertexAt(0)
+                if ownsPoint(bounds, extent, (crossPoint.x(), crossPoint.y())):
+                    errors.append((intersect, 'crossing'))
+    links, afloat = endpointLinks({fid: item['ends'] for fid, item in tileDict.items()}, bounds, extent)
+    for point in afloat:
+        errors.append((QgsGeometry.fromPointXY(QgsPointXY(*point)), 'afloat'))
+
+    return [], featureCount, owned, links, errors
+#
+def vertexCheckTiled(layer, tilesPerSide = None, workers = None, featureCap = TILE_FEATURE_CAP):
+    """
+    Tiled version of vertexCheck() for layers too large to hold in memory at once, e.g. a national layer with many groups of lines.
+    The extent of the layer (or selection) is split into a grid of tiles which are checked independently by checkTile(), in parallel if workers allows. Tiles with more than featureCap lines are split again, down to MAX_TILE_DEPTH times, as long as splitting lowers the count.
+    Only a few tiles per worker are queued at a time and results are used as soon as a tile finishes, so the geometries held at once do not depend on layer size.
+    Groups of lines crossing tile borders are stitched together from the endpoint links each tile reports. Only feature ids are held for the whole layer, never geometries.
+    No ordered point list is produced since there can be many groups, use the returned groups to fetch the lines of each polygon.
+    Runs on the calling thread and waits for the workers, so QGIS is unresponsive until the whole layer has been checked.
+    Args:
+        layer: the layer containing the line data. If features are selected only those are used
+        tilesPerSide: number of tile columns (and rows) to start from. Defaults to None which picks a grid giving roughly featureCap lines per tile
+        workers: number of tiles checked at the same time. Defaults to None which uses the number of processors
+        featureCap: most lines a tile may read before it is split. Defaults to TILE_FEATURE_CAP
+    Returns:
+        errorCount: integer of number of objects in error point layer
+        objectCount: number of line features used
+        groups: list of lists of feature ids, one list for each group of connected lines
+    """
+    errorPointLayerLabel = 'Type'
+    errorPointLayer,errorPointProvider = createMemoryLayer('Point', layer.crs(), [QgsField(errorPointLayerLabel, QMetaType.Type.QString)], 'Geometry Errors')
+    selectedIds = None
+    if layer.selectedFeatureCount() == 0:
+        extentRect = layer.extent()
+        featureCount = layer.featureCount()
+    else:
+        selectedIds = set(layer.selectedFeatureIds())
+        extentRect = layer.boundingBoxOfSelected()
+        featureCount = len(selectedIds)
+    extent = (extentRect.xMinimum(), extentRect.yMinimum(), extentRect.xMaximum(), extentRect.yMaximum())
+    if tilesPerSide is None:
+        if featureCount < 0: # Provider does not know its feature count, rely on splitting
+            tilesPerSide = 1
+        else:
+            tilesPerSide = max(1, math.ceil(math.sqrt(featureCount / featureCap)))
+    if workers is None:
+        workers = os.cpu_count() or 1
+    tileQueue = [(bounds, 0, None) for bounds in gridBounds(extent, tilesPerSide)]
+    pending = {}
+    parent = {} # Union-find over feature ids for the reconciliation of groups across tile borders
+    objectCount = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while len(tileQueue) > 0 or len(pending) > 0:
+            while len(tileQueue) > 0 and len(pending) < 2 * workers:
+                bounds, depth, parentCount = tileQueue.pop() # Last in first out so split tiles are finished before new ones are started
+                tileCap = featureCap if depth < MAX_TILE_DEPTH else None
+                # A feature source may only be used by one other thread, so each tile gets its own made here on the main thread
+                source = QgsVectorLayerFeatureSource(layer)
+                future = executor.submit(checkTile, source, bounds, extent, selectedIds, tileCap, parentCount)
+                pending[future] = depth
+            done, notDone = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                depth = pending.pop(future)
+                children, tileCount, tileOwned, tileLinks, tileErrors = future.result()
+                tileQueue.extend((child, depth + 1, tileCount) for child in children)
+                objectCount = objectCount + len(tileOwned)
+                mergeTile(parent, tileOwned, tileLinks)
+                for errorGeometry, errorText in tileErrors:
+                    addFeature(errorPointLayer,errorPointProvider, errorGeometry, [errorText])
+    groups = groupsFrom(parent)
+    errorCount = exportErrors(errorPointLayer, errorPointLayerLabel)
+
+    return errorCount, objectCount, groups
+#
 def exportErrors(errorPointLayer, errorPointLayerLabel):
     errorCount = 0
     for f in errorPointLayer.getFeatures():
@@ -338,11 +491,53 @@ def exportErrors(errorPointLayer, errorPointLayerLabel):
     
     return errorCount
 #
-def polygonise():
+def polygoniseTiled(layer):
+    """
+    Creates one polygon for each group of connected lines found by vertexCheckTiled(). Lines are fetched group by group so only one group's geometries are in memory at a time.
+    A group with more than GROUP_FEATURE_CAP lines (e.g. a connected network) is not loaded, and a group whose lines do not enclose exactly one polygon (e.g. three lines joining the same two points) is not used. Both are marked in a point layer instead.
+    Args:
+        layer: the layer containing the line data
+    Returns:
+    """
+    errorCount, objectCount, groups = vertexCheckTiled(layer)
+    if errorCount == 0:
+        vectorLayer, provider = createMemoryLayer('Polygon', layer.crs(), [QgsField('CreationDate', QMetaType.Type.QDate), QgsField('FromLines', QMetaType.Type.Int)], 'Polygon From Lines')
+        groupErrorLayerLabel = 'Type'
+        groupErrorLayer, groupErrorProvider = createMemoryLayer('Point', layer.crs(), [QgsField(groupErrorLayerLabel, QMetaType.Type.QString)], 'Group Errors')
+        for fids in groups:
+            if len(fids) > GROUP_FEATURE_CAP:
+                firstLine = next(layer.getFeatures(QgsFeatureRequest().setFilterFid(fids[0])))
+                addFeature(groupErrorLayer, groupErrorProvider, QgsGeometry.fromPointXY(getVertices(firstLine.geometry())[0]), [f'{len(fids)} lines, too many to load'])
+                continue
+            request = QgsFeatureRequest().setFilterFids(fids)
+            lineGeometries = [feature.geometry() for feature in layer.getFeatures(request)]
+            polygons = QgsGeometry.polygonize(lineGeometries).asGeometryCollection()
+            if len(polygons) == 1:
+                attributes = [QDate(date.today()), len(fids)]
+                addFeature(vectorLayer, provider, polygons[0], attributes)
+            else:
+                addFeature(groupErrorLayer, groupErrorProvider, QgsGeometry.fromPointXY(getVertices(lineGeometries[0])[0]), [f'{len(polygons)} polygons from {len(fids)} lines'])
+        QgsProject.instance().addMapLayer(vectorLayer)
+        exportErrors(groupErrorLayer, groupErrorLayerLabel)
+        messageOut(f'{objectCount} lines in {len(groups)} groups', 'Tiled mode', Qgis.Info, 10)
+
+    return
+#
+def polygonise(tiled = False):
+    """
+    Checks the lines of the active layer (or its selection) and, if there are no errors, creates a polygon from them.
+    Args:
+        tiled: check the layer tile by tile with vertexCheckTiled() and create one polygon per group of connected lines. No Used Points layer is made in this mode. Defaults to False
+    Returns:
+    """
     layer = getActive()
     if not layer == False:
         structure = layerCheck(layer)
         if structure == 'Line':
+            if tiled:
+                messageOut('Tiled mode: QGIS will not respond until the check is done. One polygon per group of connected lines, no Used Points layer', 'Tiled mode', Qgis.Info, 10)
+                polygoniseTiled(layer)
+                return
             errorCount, objectCount, pointList = vertexCheck(layer)
             if errorCount == 0:
                 usedPointLayerLabel = 'Order'
@@ -0,0 +1,52 @@
+import pytest
+
+qgisCore = pytest.importorskip('qgis.core')
+
+
+@pytest.fixture(scope='module')
+def polygonFromLines():
+    application = qgisCore.QgsApplication([], False)
+    application.initQgis()
+    from .. import polygon_from_lines
+    yield polygon_from_lines
+    application.exitQgis()
+
+
+def lineLayer(lines):
+    layer = qgisCore.QgsVectorLayer('LineString?crs=EPSG:3006', 'Lines', 'memory')
+    features = []
+    for points in lines:
+        feature = qgisCore.QgsFeature()
+        feature.setGeometry(qgisCore.QgsGeometry.fromPolylineXY([qgisCore.QgsPointXY(x, y) for x, y in points]))
+        features.append(feature)
+    layer.dataProvider().addFeatures(features)
+    layer.updateExtents()
+    return layer
+
+
+@pytest.fixture
+def countErrors(polygonFromLines, monkeypatch):
+    # exportErrors() needs the QGIS interface, count the error points instead
+    monkeypatch.setattr(polygonFromLines, 'exportErrors', lambda errorPointLayer, errorPointLayerLabel: errorPointLayer.featureCount())
+
+
+# A square ring with corners in different tiles of a 3 x 3 grid
+RING = [[(0, 0), (10, 0)], [(10, 10), (10, 0)], [(10, 10), (0, 10)], [(0, 10), (0, 0)]]
+
+
+@pytest.mark.parametrize('lines', [RING, RING + [[(4, 4), (6, 6)]]])
+def test_tiled_matches_vertex_check(polygonFromLines, countErrors, lines):
+    layer = lineLayer(lines)
+    errorCount, objectCount, pointList = polygonFromLines.vertexCheck(layer)
+    tiledErrorCount, tiledObjectCount, groups = polygonFromLines.vertexCheckTiled(layer, tilesPerSide=3, workers=2)
+    assert tiledErrorCount == errorCount
+    assert tiledObjectCount == objectCount
+    assert sorted(len(group) for group in groups)[-1] == len(RING)
+
+
+def test_tiled_split_tiles(polygonFromLines, countErrors):
+    layer = lineLayer(RING)
+    errorCount, objectCount, groups = polygonFromLines.vertexCheckTiled(layer, tilesPerSide=1, workers=2, featureCap=1)
+    assert errorCount == 0
+    assert objectCount == len(RING)
+    assert len(groups) == 1
@@ -0,0 +1,94 @@
+from ..tiling import endpointLinks, gridBounds, groupsFrom, mergeTile, ownsPoint, shouldSplit, splitBounds
+
+EXTENT = (0.0, 0.0, 10.0, 10.0)
+
+
+def leafTiles(extent):
+    # A 2 x 2 grid with the bottom left tile split once more, so tiles of different sizes meet
+    tiles = gridBounds(extent, 2)
+    return splitBounds(tiles[0]) + tiles[1:]
+
+
+def checkAllTiles(tiles, extent, endsDict):
+    # What vertexCheckTiled() does with checkTile() results, every tile reading every line
+    parent = {}
+    afloat = []
+    for bounds in tiles:
+        owned = [fid for fid in endsDict if ownsPoint(bounds, extent, endsDict[fid][0])]
+        links, tileAfloat = endpointLinks(endsDict, bounds, extent)
+        afloat.extend(tileAfloat)
+        mergeTile(parent, owned, links)
+    return sorted(sorted(group) for group in groupsFrom(parent)), sorted(afloat)
+
+
+def test_grid_tiles_share_borders():
+    tiles = gridBounds((0.0, 0.0, 1.0, 1.0), 3)
+    assert len(tiles) == 9
+    assert tiles[0][2] == tiles[1][0]
+    assert tiles[0][3] == tiles[3][1]
+    assert tiles[-1][2] == 1.0 and tiles[-1][3] == 1.0
+
+
+def test_split_bounds():
+    assert splitBounds((0.0, 0.0, 2.0, 2.0)) == [(0.0, 0.0, 1.0, 1.0), (1.0, 0.0, 2.0, 1.0), (0.0, 1.0, 1.0, 2.0), (1.0, 1.0, 2.0, 2.0)]
+    assert splitBounds((1.0, 0.0, 1.0, 2.0)) == [(1.0, 0.0, 1.0, 1.0), (1.0, 1.0, 1.0, 2.0)]
+    assert splitBounds((1.0, 1.0, 1.0, 1.0)) == []
+
+
+def test_split_only_while_count_drops():
+    assert not shouldSplit(1000, 1000)
+    assert shouldSplit(1001, 1000)
+    assert shouldSplit(1500, 1000, 2000)
+    # Long lines passing through every child keep the count up, splitting again would not help
+    assert not shouldSplit(1500, 1000, 1500)
+    assert not shouldSplit(5000, None)
+
+
+def test_border_points_owned_by_one_tile():
+    tiles = leafTiles(EXTENT)
+    points = [(x, y) for x in (0.0, 2.5, 5.0, 7.5, 10.0) for y in (0.0, 2.5, 5.0, 7.5, 10.0)]
+    for point in points:
+        owners = [bounds for bounds in tiles if ownsPoint(bounds, EXTENT, point)]
+        assert len(owners) == 1, point
+
+
+def test_zero_width_extent():
+    extent = (3.0, 0.0, 3.0, 10.0)
+    tiles = gridBounds(extent, 2)
+    for point in [(3.0, 0.0), (3.0, 5.0), (3.0, 10.0)]:
+        assert len([bounds for bounds in tiles if ownsPoint(bounds, extent, point)]) == 1
+    single = (3.0, 4.0, 3.0, 4.0)
+    assert len([bounds for bounds in gridBounds(single, 2) if ownsPoint(bounds, single, (3.0, 4.0))]) == 1
+
+
+def test_group_spread_over_tiles():
+    # A ring through every tile with corners on tile borders, and a separate line with one loose end
+    endsDict = {
+        1: ((1.0, 1.0), (5.0, 1.0)),
+        2: ((9.0, 5.0), (5.0, 1.0)),
+        3: ((9.0, 5.0), (5.0, 9.0)),
+        4: ((5.0, 9.0), (1.0, 5.0)),
+        5: ((1.0, 1.0), (1.0, 5.0)),
+        6: ((6.0, 6.0), (8.0, 8.0)),
+        7: ((8.0, 8.0), (8.0, 8.0)),
+    }
+    groups, afloat = checkAllTiles(leafTiles(EXTENT), EXTENT, endsDict)
+    assert groups == [[1, 2, 3, 4, 5], [6, 7]]
+    assert afloat == [(6.0, 6.0)]
+
+
+def test_closed_single_line_not_afloat():
+    endsDict = {1: ((2.0, 2.0), (2.0, 2.0))}
+    groups, afloat = checkAllTiles(leafTiles(EXTENT), EXTENT, endsDict)
+    assert groups == [[1]]
+    assert afloat == []
+
+
+def test_nearly_equal_endpoints_match():
+    endsDict = {
+        1: ((1.0, 1.0), (5.0, 5.0)),
+        2: ((5.0 + 1e-10, 5.0 - 1e-10), (1.0, 1.0)),
+    }
+    groups, afloat = checkAllTiles(leafTiles(EXTENT), EXTENT, endsDict)
+    assert groups == [[1, 2]]
+    assert afloat == []
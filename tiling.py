@@ -0,0 +1,190 @@
+"""
+Plain Python helpers for the tiled check in polygon_from_lines. Nothing here needs QGIS so the tile ownership and group stitching can be tested on their own.
+Bounds and extents are tuples (xMin, yMin, xMax, yMax), points are tuples (x, y).
+"""
+
+# Endpoints closer than this are the same point, as for QgsPointXY == in vertexCheck()
+ENDPOINT_TOLERANCE = 1e-8
+
+# Functions
+#
+def gridBounds(extent, tilesPerSide):
+    """
+    Lays a tilesPerSide x tilesPerSide grid over the extent. Neighbouring tiles share exactly the same border value so no point can fall between them.
+    A side of zero length (e.g. lines all on one vertical) gets a single column or row.
+    Args:
+        extent: bounds tuple covering all the lines to be checked
+        tilesPerSide: number of tile columns (and rows)
+    Returns:
+        tiles: list of bounds tuples, row by row from the bottom left corner
+    """
+    xMin, yMin, xMax, yMax = extent
+    cols = tilesPerSide if xMax > xMin else 1
+    rows = tilesPerSide if yMax > yMin else 1
+    xEdges = [xMin + i * (xMax - xMin) / cols for i in range(cols)] + [xMax]
+    yEdges = [yMin + i * (yMax - yMin) / rows for i in range(rows)] + [yMax]
+    tiles = []
+    for row in range(rows):
+        for col in range(cols):
+            tiles.append((xEdges[col], yEdges[row], xEdges[col + 1], yEdges[row + 1]))
+
+    return tiles
+#
+def splitBounds(bounds):
+    """
+    Splits a tile into halves along each side that can still be split, i.e. into four, two or (for a single point) no tiles.
+    Args:
+        bounds: bounds tuple of the tile
+    Returns:
+        tiles: list of bounds tuples, empty if the tile cannot be split
+    """
+    xMin, yMin, xMax, yMax = bounds
+    xMid = (xMin + xMax) / 2
+    yMid = (yMin + yMax) / 2
+    xRanges = [(xMin, xMid), (xMid, xMax)] if xMin < xMid < xMax else [(xMin, xMax)]
+    yRanges = [(yMin, yMid), (yMid, yMax)] if yMin < yMid < yMax else [(yMin, yMax)]
+    if len(xRanges) == 1 and len(yRanges) == 1:
+        return []
+    tiles = [(x0, y0, x1, y1) for y0, y1 in yRanges for x0, x1 in xRanges]
+
+    return tiles
+#
+def shouldSplit(featureCount, featureCap, parentCount = None):
+    """
+    Should a tile reading featureCount lines be split. The count is of every line whose bounding box meets the tile, including long lines only passing through, and splitting cannot get rid of those since every child meets them too.
+    So a tile is only split if it is over the cap and, for a tile that is itself the result of a split, reads fewer lines than its parent did.
+    Args:
+        featureCount: number of lines the tile reads
+        featureCap: most lines a tile may read before it is split, None for no limit
+        parentCount: number of lines the parent tile read. Defaults to None for a starting tile
+    Returns:
+        True or False
+    """
+    if featureCap is None or featureCount <= featureCap:
+        return False
+    if parentCount is not None and featureCount >= parentCount:
+        return False
+
+    return True
+#
+def snapPoint(point):
+    """
+    Rounds a point to the ENDPOINT_TOLERANCE grid so that nearly equal endpoints get the same key and the same owning tile.
+    Args:
+        point: (x, y) tuple
+    Returns:
+        snapped: (x, y) tuple
+    """
+    x, y = point
+    snapped = (round(x / ENDPOINT_TOLERANCE) * ENDPOINT_TOLERANCE, round(y / ENDPOINT_TOLERANCE) * ENDPOINT_TOLERANCE)
+
+    return snapped
+#
+def ownsPoint(bounds, extent, point):
+    """
+    Does the tile own the point. Tiles own their lower and left borders but not their upper and right ones, except along the edge of the extent, so every point is owned by exactly one tile.
+    Args:
+        bounds: bounds tuple of the tile
+        extent: bounds tuple the tiles were made from
+        point: (x, y) tuple
+    Returns:
+        True or False
+    """
+    x, y = point
+    xMin, yMin, xMax, yMax = bounds
+    inX = (x >= xMin or xMin <= extent[0]) and (x < xMax or xMax >= extent[2])
+    inY = (y >= yMin or yMin <= extent[1]) and (y < yMax or yMax >= extent[3])
+
+    return inX and inY
+#
+def endpointLinks(endsDict, bounds, extent):
+    """
+    Matches line endpoints owned by the tile. Lines meeting at an endpoint are linked, an endpoint met by no other line is afloat unless the line closes on itself.
+    Endpoints are compared after snapPoint() so points within ENDPOINT_TOLERANCE of each other match.
+    Args:
+        endsDict: dictionary of feature id: ((x, y) first vertex, (x, y) last vertex) for every line read for the tile
+        bounds: bounds tuple of the tile
+        extent: bounds tuple the tiles were made from
+    Returns:
+        links: list of (fid, gid) pairs of lines sharing an endpoint
+        afloat: list of (x, y) endpoints (snapped) not shared with another line
+    """
+    snappedDict = {fid: (snapPoint(ends[0]), snapPoint(ends[-1])) for fid, ends in endsDict.items()}
+    endpointDict = {}
+    for fid, ends in snappedDict.items():
+        for point in ends:
+            if ownsPoint(bounds, extent, point):
+                endpointDict.setdefault(point, set()).add(fid)
+    links = []
+    afloat = []
+    for point, fids in endpointDict.items():
+        fids = sorted(fids)
+        if len(fids) == 1 and snappedDict[fids[0]][0] != snappedDict[fids[0]][1]:
+            afloat.append(point)
+        for gid in fids[1:]:
+            links.append((fids[0], gid))
+
+    return links, afloat
+#
+def findRoot(parent, fid):
+    """
+    Union-find lookup of the group a line belongs to, adding the line as its own group if it is new.
+    Args:
+        parent: dictionary of feature id: parent feature id, updated in place
+        fid: feature id
+    Returns:
+        root: feature id standing for the whole group
+    """
+    root = parent.setdefault(fid, fid)
+    while parent[root] != root:
+        root = parent[root]
+    while parent[fid] != root:
+        parent[fid], fid = root, parent[fid]
+
+    return root
+#
+def joinGroups(parent, fid, gid):
+    """
+    Union-find merge of the groups of two linked lines.
+    Args:
+        parent: dictionary of feature id: parent feature id, updated in place
+        fid, gid: feature ids of the linked lines
+    Returns:
+    """
+    fidRoot = findRoot(parent, fid)
+    gidRoot = findRoot(parent, gid)
+    if fidRoot != gidRoot:
+        parent[gidRoot] = fidRoot
+
+    return
+#
+def mergeTile(parent, owned, links):
+    """
+    Adds the result of one tile to the union-find, joining groups that reach over tile borders.
+    Args:
+        parent: dictionary of feature id: parent feature id, updated in place
+        owned: list of ids for features owned by the tile
+        links: list of (fid, gid) pairs of lines sharing an endpoint in the tile
+    Returns:
+    """
+    for fid in owned:
+        findRoot(parent, fid)
+    for fid, gid in links:
+        joinGroups(parent, fid, gid)
+
+    return
+#
+def groupsFrom(parent):
+    """
+    Collects the union-find result into groups.
+    Args:
+        parent: dictionary of feature id: parent feature id
+    Returns:
+        groups: list of lists of feature ids, one list for each group of connected lines
+    """
+    groupDict = {}
+    for fid in list(parent):
+        groupDict.setdefault(findRoot(parent, fid), []).append(fid)
+    groups = list(groupDict.values())
+
+    return groups